@@ -1,6 +1,7 @@
 import itertools
 from typing import Callable, Dict, Iterable, List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event
@@ -35,9 +36,14 @@ class ResultsStratifier:
         columns_required = ['tracked']
 
         def get_state_function(column_name: str, state: Union[str, bool, List]) -> Callable:
-            return lambda pop: (pop[column_name] == state
-                                if not isinstance(state, List)
-                                else pop[column_name].isin(state))
+            states = state if isinstance(state, List) else [state]
+
+            def in_state(pop: pd.DataFrame) -> np.ndarray:
+                # A few equality checks are cheaper than the hash table isin builds for small state lists
+                values = pop[column_name].to_numpy()
+                return np.logical_or.reduce([values == s for s in states])
+
+            return in_state
 
         self.stratification_levels = {}
 
@@ -48,6 +54,9 @@ class ResultsStratifier:
             }
             self.pipelines[data_keys.WASTING.name] = builder.value.get_value(f'{data_keys.WASTING.name}.exposure')
 
+        # Stratification levels are fixed after setup, so only enumerate their combinations once
+        self.stratifications = self.get_all_stratifications()
+
         self.population_view = builder.population.get_view(columns_required)
         self.stratification_groups: pd.Series = None
 
@@ -61,19 +70,30 @@ class ResultsStratifier:
 
     def get_stratification_groups(self, index: pd.Index):
         #  get values required for stratification from population view and pipelines
-        pop_list = [self.population_view.get(index)] + [pd.Series(pipeline(index), name=name)
-                                                        for name, pipeline in self.pipelines.items()]
-        pop = pd.concat(pop_list, axis=1)
-
-        stratification_groups = pd.Series('', index=index)
-        all_stratifications = self.get_all_stratifications()
-        for stratification in all_stratifications:
-            stratification_group_name = '_'.join([f'{metric["metric"]}_{metric["category"]}'
-                                                  for metric in stratification]).lower()
-            mask = pd.Series(True, index=index)
+        pop = self.population_view.get(index)
+        for name, pipeline in self.pipelines.items():
+            pop[name] = pipeline(index)
+
+        # Bind lookups used in the loops below to locals
+        stratification_levels = self.stratification_levels
+        population_size = len(index)
+
+        stratification_group_names = []
+        stratification_group_masks = []
+        for stratification in self.stratifications:
+            stratification_group_names.append('_'.join([f'{metric["metric"]}_{metric["category"]}'
+                                                        for metric in stratification]).lower())
+            mask = np.ones(population_size, dtype=bool)
             for metric in stratification:
-                mask &= self.stratification_levels[metric['metric']][metric['category']](pop)
-            stratification_groups.loc[mask] = stratification_group_name
+                mask &= stratification_levels[metric['metric']][metric['category']](pop)
+            stratification_group_masks.append(mask)
+
+        # Store groups as a categorical so each simulant holds a small integer code rather than a label string.
+        # np.select takes the first matching condition, so reverse to let later stratifications take precedence
+        group_codes = np.select(stratification_group_masks[::-1],
+                                list(range(len(stratification_group_names)))[::-1], default=-1)
+        stratification_groups = pd.Series(pd.Categorical.from_codes(group_codes, stratification_group_names),
+                                          index=index)
         return stratification_groups
 
     def get_all_stratifications(self) -> List[Tuple[Dict[str, str], ...]]:
@@ -114,9 +134,9 @@ class ResultsStratifier:
         pop = pop.loc[index]
         stratification_groups = self.stratification_groups.loc[index]
 
-        stratifications = self.get_all_stratifications()
-        for stratification in stratifications:
-            stratification_key = self.get_stratification_key(stratification)
+        get_stratification_key = self.get_stratification_key
+        for stratification in self.stratifications:
+            stratification_key = get_stratification_key(stratification)
             if pop.empty:
                 pop_in_group = pop
             else:
@@ -159,7 +179,7 @@ class MortalityObserver(MortalityObserver_):
 
     def metrics(self, index: pd.Index, metrics: Dict[str, float]) -> Dict[str, float]:
         pop = self.population_view.get(index)
-        pop.loc[pop.exit_time.isnull(), 'exit_time'] = self.clock()
+        pop['exit_time'] = pop['exit_time'].fillna(self.clock())
 
         measure_getters = (
             (get_deaths, (self.causes,)),
@@ -212,8 +232,7 @@ class DiseaseObserver(DiseaseObserver_):
                 self.person_time.update(state_person_time_this_step)
 
         # This enables tracking of transitions between states
-        prior_state_pop = self.population_view.get(event.index)
-        prior_state_pop[self.previous_state_column] = prior_state_pop[self.disease]
+        prior_state_pop = pd.DataFrame({self.previous_state_column: pop[self.disease]})
         self.population_view.update(prior_state_pop)
 
     def on_collect_metrics(self, event: Event):
@@ -242,8 +261,8 @@ class CategoricalRiskObserver(CategoricalRiskObserver_):
         return [self.stratifier]
 
     def on_time_step_prepare(self, event: Event):
-        pop = pd.concat([self.population_view.get(event.index), pd.Series(self.exposure(event.index), name=self.risk)],
-                        axis=1)
+        pop = self.population_view.get(event.index)
+        pop[self.risk] = self.exposure(event.index)
         # Ignoring the edge case where the step spans a new year.
         # Accrue all counts and time to the current year.
         for labels, pop_in_group in self.stratifier.group(pop):
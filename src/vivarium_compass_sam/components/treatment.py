@@ -1,7 +1,11 @@
 """Prevention and treatment models"""
+from typing import Callable, Dict, Tuple
+
+import numpy as np
 import pandas as pd
 
 from vivarium.framework.engine import Builder
+from vivarium.framework.event import Event
 
 from vivarium_compass_sam.constants import data_keys, data_values, scenarios
 from vivarium_compass_sam.utilities import get_random_variable
@@ -22,6 +26,9 @@ class SQLNSTreatment:
 
         self.severe_wasting_risk_ratio = get_random_variable(draw, *data_values.SQ_LNS.RISK_RATIO_WASTING_SEVERE)
         self.moderate_wasting_risk_ratio = get_random_variable(draw, *data_values.SQ_LNS.RISK_RATIO_WASTING_MODERATE)
+        # Fraction of the exposure in each category moved to cat3 among those covered
+        self.severe_wasting_decrease = 1 - self.severe_wasting_risk_ratio
+        self.moderate_wasting_decrease = 1 - self.moderate_wasting_risk_ratio
 
         required_columns = ['age']
 
@@ -38,19 +45,60 @@ class SQLNSTreatment:
         )
 
         self.population_view = builder.population.get_view(required_columns)
+        self._coverage_cache = {}
+
+        builder.event.register_listener('time_step__prepare', self.on_time_step_prepare, priority=0)
+        # vivarium_public_health's BasePopulation ages simulants in its time_step listener at priority 8,
+        # so the caches must be cleared after that, at priority 9, or coverage would use stale ages
+        builder.event.register_listener('time_step', self.on_time_step, priority=9)
+
+    # noinspection PyUnusedLocal
+    def on_time_step_prepare(self, event: Event):
+        self.clear_caches()
+
+    # noinspection PyUnusedLocal
+    def on_time_step(self, event: Event):
+        self.clear_caches()
+
+    def clear_caches(self):
+        self._coverage_cache = {}
+
+    @staticmethod
+    def lookup_by_index(cache: Dict[int, Tuple[pd.Index, pd.Series]], index: pd.Index,
+                        compute: Callable[[pd.Index], pd.Series]) -> pd.Series:
+        """Returns the cached value for this index object, computing and storing it if missing.
+
+        Each entry keeps a reference to its index, so an index id cannot be
+        reused by another object while the entry is in the cache.
+
+        """
+        if id(index) not in cache:
+            cache[id(index)] = (index, compute(index))
+        return cache[id(index)][1]
 
     def get_current_coverage(self, index: pd.Index) -> pd.Series:
-        age = self.population_view.get(index)['age']
-        coverage = self.scenario.has_sqlns & (data_values.SQ_LNS.COVERAGE_START_AGE <= age)
-        return coverage
+        # Pipeline consumers may modify the value they get, so never hand out the cached series itself
+        return self.lookup_by_index(self._coverage_cache, index, self._compute_coverage).copy()
+
+    def _compute_coverage(self, index: pd.Index) -> pd.Series:
+        if not self.scenario.has_sqlns:
+            return pd.Series(False, index=index)
+
+        age = self.population_view.get(index)['age'].to_numpy()
+        return pd.Series(data_values.SQ_LNS.COVERAGE_START_AGE <= age, index=index)
 
     def apply_wasting_prevention(self, index: pd.Index, target: pd.DataFrame) -> pd.Series:
-        cat1_decrease = target.loc[:, 'cat1'] * (1 - self.severe_wasting_risk_ratio)
-        cat2_decrease = target.loc[:, 'cat2'] * (1 - self.moderate_wasting_risk_ratio)
-
-        covered = self.coverage(index)
-        target.loc[covered, 'cat1'] = target.loc[covered, 'cat1'] - cat1_decrease.loc[covered]
-        target.loc[covered, 'cat2'] = target.loc[covered, 'cat2'] - cat2_decrease.loc[covered]
-        target.loc[covered, 'cat3'] = (target.loc[covered, 'cat3']
-                                       + cat1_decrease.loc[covered] + cat2_decrease.loc[covered])
+        if not self.scenario.has_sqlns:
+            # No simulants can be covered, so the exposure parameters are unchanged
+            return target
+
+        covered = self.coverage(index).to_numpy()
+        affected_categories = ['cat1', 'cat2', 'cat3']
+
+        exposure = target.loc[covered, affected_categories].to_numpy()
+        cat1_decrease = exposure[:, 0] * self.severe_wasting_decrease
+        cat2_decrease = exposure[:, 1] * self.moderate_wasting_decrease
+        exposure_shift = np.column_stack([-cat1_decrease, -cat2_decrease, cat1_decrease + cat2_decrease])
+
+        target.loc[covered, affected_categories] = exposure + exposure_shift
         return target
@@ -28,10 +28,17 @@ class __SQLNS(NamedTuple):
     COVERAGE_START_AGE: float = 0.5
     COVERAGE_BASELINE: float = 0.0
     COVERAGE_RAMP_UP: float = 0.9
-    RISK_RATIO_WASTING_SEVERE: Tuple = ('sq_lns_severe_wasting_effect',
-                                        get_lognorm_from_quantiles(median=0.85, lower=0.74, upper=0.98))
-    RISK_RATIO_WASTING_MODERATE: Tuple = ('sq_lns_moderate_wasting_effect',
-                                          get_lognorm_from_quantiles(median=0.82, lower=0.74, upper=0.91))
+
+    # Distributions are only built when a component asks for them rather than on import
+    @property
+    def RISK_RATIO_WASTING_SEVERE(self) -> Tuple:
+        return ('sq_lns_severe_wasting_effect',
+                get_lognorm_from_quantiles(median=0.85, lower=0.74, upper=0.98))
+
+    @property
+    def RISK_RATIO_WASTING_MODERATE(self) -> Tuple:
+        return ('sq_lns_moderate_wasting_effect',
+                get_lognorm_from_quantiles(median=0.82, lower=0.74, upper=0.91))
 
 
 SQ_LNS = __SQLNS()
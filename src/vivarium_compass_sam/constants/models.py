@@ -1,3 +1,5 @@
+import sys
+from itertools import chain
 from typing import List, Tuple
 
 from vivarium_compass_sam.constants import data_keys
@@ -37,5 +39,5 @@ CAUSE_MODELS: List[__SISModel] = [
 ]
 
 
-DISEASE_STATES = tuple(state for model in CAUSE_MODELS for state in model.STATES)
-DISEASE_TRANSITIONS = tuple(state for model in CAUSE_MODELS for state in model.TRANSITIONS)
+DISEASE_STATES = tuple(sys.intern(state) for state in chain.from_iterable(model.STATES for model in CAUSE_MODELS))
+DISEASE_TRANSITIONS = tuple(chain.from_iterable(model.TRANSITIONS for model in CAUSE_MODELS))
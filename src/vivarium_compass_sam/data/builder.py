@@ -10,6 +10,7 @@ Some degree of verbosity/boilerplate is fine in the interest of transparancy.
 
 """
 from pathlib import Path
+from typing import List, Tuple
 
 from loguru import logger
 import pandas as pd
@@ -48,6 +49,33 @@ def open_artifact(output_path: Path, location: str) -> Artifact:
     return artifact
 
 
+def preload_data(artifact: Artifact, keys: List[str], location: str, replace_keys: Tuple, max_workers: int):
+    """Loads data for every key that will be written, fetching independent keys concurrently.
+
+    Failures are logged rather than raised; the key is loaded again when it is written.
+
+    Parameters
+    ----------
+    artifact
+        The artifact that will be written to.
+    keys
+        The entity keys associated with the data to write.
+    location
+        The location associated with the data to load.
+    replace_keys
+        Keys which will be overwritten if already present.
+    max_workers
+        The maximum number of keys to load at once.
+
+    """
+    keys_to_load = [key for key in keys if key not in artifact or key in replace_keys]
+    logger.debug(f'Preloading data for {len(keys_to_load)} keys for location {location} '
+                 f'with {max_workers} workers.')
+    errors = loader.load_data_batch(keys_to_load, location, max_workers)
+    for key, error in errors.items():
+        logger.warning(f'Failed to preload data for {key}: {error!r}. It will be loaded again when written.')
+
+
 def load_and_write_data(artifact: Artifact, key: str, location: str, replace: bool):
     """Loads data and writes it to the artifact if not already present.
 
@@ -66,16 +94,18 @@ def load_and_write_data(artifact: Artifact, key: str, location: str, replace: bo
     """
     if key in artifact and not replace:
         logger.debug(f'Data for {key} already in artifact.  Skipping...')
-    else:
-        logger.debug(f'Loading data for {key} for location {location}.')
-        data = loader.get_data(key, location)
-        if key not in artifact:
-            logger.debug(f'Writing data for {key} to artifact.')
-            artifact.write(key, data)
-        else:   # key is in artifact, but should be replaced
-            logger.debug(f'Replacing data for {key} in artifact.')
-            artifact.replace(key, data)
-    return artifact.load(key)
+        return artifact.load(key)
+
+    logger.debug(f'Loading data for {key} for location {location}.')
+    data = loader.get_data(key, location)
+    if key not in artifact:
+        logger.debug(f'Writing data for {key} to artifact.')
+        artifact.write(key, data)
+    else:   # key is in artifact, but should be replaced
+        logger.debug(f'Replacing data for {key} in artifact.')
+        artifact.replace(key, data)
+    # No need to read back from disk what was just written
+    return data
 
 
 def write_data(artifact: Artifact, key: str, data: pd.DataFrame):
@@ -93,10 +123,11 @@ def write_data(artifact: Artifact, key: str, data: pd.DataFrame):
     """
     if key in artifact:
         logger.debug(f'Data for {key} already in artifact.  Skipping...')
-    else:
-        logger.debug(f'Writing data for {key} to artifact.')
-        artifact.write(key, data)
-    return artifact.load(key)
+        return artifact.load(key)
+
+    logger.debug(f'Writing data for {key} to artifact.')
+    artifact.write(key, data)
+    return data
 
 
 # TODO - writing and reading by draw is necessary if you are using
@@ -12,6 +12,12 @@ for an example.
 
    No logging is done here. Logging is done in vivarium inputs itself and forwarded.
 """
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List
+
 import numpy as np
 import pandas as pd
 
@@ -23,6 +29,10 @@ from vivarium_inputs import globals as vi_globals, interface, utilities as vi_ut
 from vivarium_compass_sam.constants import data_keys, data_values, metadata
 from vivarium_compass_sam.data import utilities
 
+# Columns kept from raw relative risk draws, built once rather than on every load
+_RR_DATA_COLUMNS = (vi_globals.DEMOGRAPHIC_COLUMNS + ['affected_entity', 'affected_measure', 'parameter']
+                    + vi_globals.DRAW_COLUMNS)
+
 
 def get_data(lookup_key: str, location: str) -> pd.DataFrame:
     """Retrieves data from an appropriate source.
@@ -40,36 +50,68 @@ def get_data(lookup_key: str, location: str) -> pd.DataFrame:
         The requested data.
 
     """
-    mapping = {
-        data_keys.POPULATION.LOCATION: load_population_location,
-        data_keys.POPULATION.STRUCTURE: load_population_structure,
-        data_keys.POPULATION.AGE_BINS: load_age_bins,
-        data_keys.POPULATION.DEMOGRAPHY: load_demographic_dimensions,
-        data_keys.POPULATION.TMRLE: load_theoretical_minimum_risk_life_expectancy,
-        data_keys.POPULATION.ACMR: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.POPULATION.CRUDE_BIRTH_RATE: load_standard_data,
-
-        data_keys.LRI.PREVALENCE: load_lri_prevalence,
-        data_keys.LRI.INCIDENCE_RATE: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.LRI.REMISSION_RATE: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.LRI.DISABILITY_WEIGHT: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.LRI.EMR: load_lri_excess_mortality_rate,
-        data_keys.LRI.CSMR: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.LRI.RESTRICTIONS: load_metadata,
-
-        data_keys.PEM.DISABILITY_WEIGHT: load_pem_disability_weight,
-        data_keys.PEM.EMR: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.PEM.CSMR: load_standard_gbd_2019_data_as_gbd_2020_data,
-        data_keys.PEM.RESTRICTIONS: load_metadata,
-
-        data_keys.WASTING.DISTRIBUTION: load_metadata,
-        data_keys.WASTING.ALT_DISTRIBUTION: load_metadata,
-        data_keys.WASTING.CATEGORIES: load_metadata,
-        data_keys.WASTING.EXPOSURE: load_gbd_2020_exposure,
-        data_keys.WASTING.RELATIVE_RISK: load_gbd_2020_rr,
-        data_keys.WASTING.PAF: load_paf,
-    }
-    return mapping[lookup_key](lookup_key, location)
+    # Loaders pull other keys through here (e.g. LRI prevalence for the EMR), so
+    # each key is only loaded once and callers get a copy to modify freely.
+    data = _get_cached_data(lookup_key, location)
+    return data.copy() if hasattr(data, 'copy') else data
+
+
+def _get_cached_data(lookup_key: str, location: str):
+    # Concurrent requests for the same key wait on its lock rather than loading it again.
+    with _DATA_LOCKS_GUARD:
+        key_lock = _DATA_LOCKS[(lookup_key, location)]
+    with key_lock:
+        return _get_data(lookup_key, location)
+
+
+_DATA_LOCKS_GUARD = Lock()
+_DATA_LOCKS = defaultdict(Lock)
+
+
+def clear_data_cache() -> None:
+    """Drops all data cached by :func:`get_data`."""
+    _get_data.cache_clear()
+
+
+def load_data_batch(lookup_keys: List[str], location: str, max_workers: int = 8) -> Dict[str, Exception]:
+    """Loads data for several keys into the :func:`get_data` cache, loading
+    independent keys concurrently. No data is returned, so no copies are made.
+
+    Parameters
+    ----------
+    lookup_keys
+        The keys that will eventually get put in the artifact with
+        the requested data.
+    location
+        The location to get data for.
+    max_workers
+        The maximum number of keys to load at once.
+
+    Returns
+    -------
+        The error raised for each key that failed to load. Failed keys are
+        not cached, so a later :func:`get_data` call tries them again.
+
+    """
+    errors = {}
+    pending = list(dict.fromkeys(lookup_keys))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            # Derived keys wait until the keys they are built from have been loaded
+            ready = [key for key in pending if not set(DATA_DEPENDENCIES.get(key, [])).intersection(pending)]
+            if not ready:
+                raise ValueError(f'Circular data dependencies among keys {pending}.')
+            futures = {key: executor.submit(_get_cached_data, key, location) for key in ready}
+            for key, future in futures.items():
+                if future.exception() is not None:
+                    errors[key] = future.exception()
+            pending = [key for key in pending if key not in ready]
+    return errors
+
+
+@lru_cache(maxsize=None)
+def _get_data(lookup_key: str, location: str):
+    return DATA_LOADERS[lookup_key](lookup_key, location)
 
 
 def load_population_location(key: str, location: str) -> str:
@@ -133,12 +175,13 @@ def load_standard_gbd_2019_data_as_gbd_2020_data(key: str, location: str) -> pd.
 
 def load_lri_prevalence(key: str, location: str) -> pd.DataFrame:
     if key == data_keys.LRI.PREVALENCE:
+        # Keep DATA_DEPENDENCIES in sync with the keys loaded here
         incidence_rate = get_data(data_keys.LRI.INCIDENCE_RATE, location)
-        early_neonatal_prevalence = (incidence_rate[incidence_rate.index.get_level_values('age_start') == 0.0]
-                                     * data_values.EARLY_NEONATAL_CAUSE_DURATION / 365)
-        all_other_prevalence = (incidence_rate[incidence_rate.index.get_level_values('age_start') != 0.0]
-                                * data_values.LRI_DURATION / 365)
-        prevalence = pd.concat([early_neonatal_prevalence, all_other_prevalence])
+        is_early_neonatal = incidence_rate.index.get_level_values('age_start') == 0.0
+        # LRI duration in years for each row
+        duration = np.where(is_early_neonatal,
+                            data_values.EARLY_NEONATAL_CAUSE_DURATION, data_values.LRI_DURATION) / 365
+        prevalence = incidence_rate.mul(duration, axis=0)
         return prevalence
     else:
         raise ValueError(f'Unrecognized key {key}')
@@ -146,10 +189,12 @@ def load_lri_prevalence(key: str, location: str) -> pd.DataFrame:
 
 def load_lri_excess_mortality_rate(key: str, location: str) -> pd.DataFrame:
     if key == data_keys.LRI.EMR:
+        # Keep DATA_DEPENDENCIES in sync with the keys loaded here
         csmr = get_data(data_keys.LRI.CSMR, location)
         prevalence = get_data(data_keys.LRI.PREVALENCE, location)
-        data = (csmr / prevalence).fillna(0)
-        data = data.replace([np.inf, -np.inf], 0)
+        # Rows missing from either side are treated as zero, as is EMR wherever prevalence is zero
+        csmr, prevalence = csmr.align(prevalence, fill_value=0)
+        data = _safe_divide(csmr, prevalence)
         return data
     else:
         raise ValueError(f'Unrecognized key {key}')
@@ -186,17 +231,15 @@ def load_gbd_2020_rr(key: str, location: str) -> pd.DataFrame:
     data.loc[~morbidity & mortality, 'affected_measure'] = 'excess_mortality_rate'
     data = utilities.filter_relative_risk_to_cause_restrictions(data)
 
-    data = data.filter(vi_globals.DEMOGRAPHIC_COLUMNS + ['affected_entity', 'affected_measure', 'parameter']
-                       + vi_globals.DRAW_COLUMNS)
+    data = data.filter(_RR_DATA_COLUMNS)
     data = (data.groupby(['affected_entity', 'parameter'])
             .apply(utilities.normalize_age_and_years, fill_value=1, gbd_round_id=metadata.GBD_2020_ROUND_ID)
             .reset_index(drop=True))
 
     tmrel_cat = utility_data.get_tmrel_category(entity)
     tmrel_mask = data.parameter == tmrel_cat
-    data.loc[tmrel_mask, vi_globals.DRAW_COLUMNS] = (data.loc[tmrel_mask, vi_globals.DRAW_COLUMNS]
-                                                     .mask(np.isclose(data.loc[tmrel_mask, vi_globals.DRAW_COLUMNS],
-                                                                      1.0), 1.0))
+    tmrel_draws = data.loc[tmrel_mask, vi_globals.DRAW_COLUMNS]
+    data.loc[tmrel_mask, vi_globals.DRAW_COLUMNS] = tmrel_draws.mask(np.isclose(tmrel_draws, 1.0), 1.0)
 
     data = utilities.validate_and_reshape_gbd_data(data, entity, key, location, metadata.GBD_2020_AGE_GROUPS,
                                                    metadata.GBD_2020_ROUND_ID)
@@ -210,16 +253,17 @@ def load_paf(key: str, location: str) -> pd.DataFrame:
             data_keys.WASTING.PAF: data_keys.WASTING,
         }[key]
 
+        # Keep DATA_DEPENDENCIES in sync with the keys loaded here
         exp = get_data(risk.EXPOSURE, location)
         rr = get_data(risk.RELATIVE_RISK, location)
 
         # paf = (sum_categories(exp * rr) - 1) / sum_categories(exp * rr)
-        sum_exp_x_rr = (
-            (exp * rr)
-            .groupby(list(set(rr.index.names) - {'parameter'})).sum()
-            .reset_index()
-            .set_index(rr.index.names[:-1])
-        )
+        # Line exposure up with the relative risk rows once, so the product needs no index join
+        exp = exp.reindex(rr.index.droplevel([name for name in rr.index.names if name not in exp.index.names])
+                          .reorder_levels(exp.index.names), columns=rr.columns)
+        exp_x_rr = pd.DataFrame(exp.to_numpy() * rr.to_numpy(), index=rr.index, columns=rr.columns)
+        non_parameter_levels = [name for name in rr.index.names if name != 'parameter']
+        sum_exp_x_rr = exp_x_rr.groupby(level=non_parameter_levels).sum()
         paf = (sum_exp_x_rr - 1) / sum_exp_x_rr
         return paf
     else:
@@ -233,21 +277,74 @@ def load_pem_disability_weight(key: str, location: str) -> pd.DataFrame:
                         sequelae.severe_wasting_with_edema,
                         sequelae.severe_wasting_without_edema]
 
-        prevalence_disability_weight = []
-        state_prevalence = []
-        for s in sequela_list:
-            sequela_prevalence = interface.get_measure(s, 'prevalence', location)
-            sequela_disability_weight = interface.get_measure(s, 'disability_weight', location)
-
-            prevalence_disability_weight += [sequela_prevalence * sequela_disability_weight]
-            state_prevalence += [sequela_prevalence]
-
-        gbd_2019_disability_weight = (
-            (sum(prevalence_disability_weight) / sum(state_prevalence))
-            .fillna(0)
-            .droplevel('location')
-        )
+        sequela_prevalence = [interface.get_measure(s, 'prevalence', location) for s in sequela_list]
+        sequela_disability_weight = [interface.get_measure(s, 'disability_weight', location) for s in sequela_list]
+        index, columns = sequela_prevalence[0].index, sequela_prevalence[0].columns
+        for s, prevalence_data, disability_weight_data in zip(sequela_list, sequela_prevalence,
+                                                              sequela_disability_weight):
+            for data in [prevalence_data, disability_weight_data]:
+                if not (data.index.equals(index) and data.columns.equals(columns)):
+                    raise vi_globals.DataAbnormalError(f'Data for sequela {s.name} are not aligned with '
+                                                       f'{sequela_list[0].name} prevalence.')
+
+        # Stack sequelae so the weighted sum is one reduction; the weight is 0 wherever there is no prevalence
+        prevalence = np.stack([p.to_numpy() for p in sequela_prevalence])
+        disability_weights = np.stack([dw.to_numpy() for dw in sequela_disability_weight])
+        prevalence_disability_weight = pd.DataFrame((prevalence * disability_weights).sum(axis=0),
+                                                    index=index, columns=columns)
+        state_prevalence = pd.DataFrame(prevalence.sum(axis=0), index=index, columns=columns)
+        gbd_2019_disability_weight = _safe_divide(prevalence_disability_weight, state_prevalence).droplevel('location')
         disability_weight = utilities.reshape_gbd_2019_data_as_gbd_2020_data(gbd_2019_disability_weight)
         return disability_weight
     else:
         raise ValueError(f'Unrecognized key {key}')
+
+
+def _safe_divide(numerator: pd.DataFrame, denominator: pd.DataFrame) -> pd.DataFrame:
+    """Divides aligned frames, giving 0 wherever the denominator is 0 or either side
+    is nan or inf, so no nan or inf reaches the result."""
+    numerator_values, denominator_values = numerator.to_numpy(), denominator.to_numpy()
+    divisible = np.isfinite(numerator_values) & np.isfinite(denominator_values) & (denominator_values != 0)
+    quotient = np.divide(numerator_values, denominator_values, out=np.zeros_like(numerator_values, dtype=float),
+                         where=divisible)
+    return pd.DataFrame(quotient, index=numerator.index, columns=numerator.columns)
+
+
+# Built once the loaders above are defined; get_data looks keys up here
+DATA_LOADERS = {
+    data_keys.POPULATION.LOCATION: load_population_location,
+    data_keys.POPULATION.STRUCTURE: load_population_structure,
+    data_keys.POPULATION.AGE_BINS: load_age_bins,
+    data_keys.POPULATION.DEMOGRAPHY: load_demographic_dimensions,
+    data_keys.POPULATION.TMRLE: load_theoretical_minimum_risk_life_expectancy,
+    data_keys.POPULATION.ACMR: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.POPULATION.CRUDE_BIRTH_RATE: load_standard_data,
+
+    data_keys.LRI.PREVALENCE: load_lri_prevalence,
+    data_keys.LRI.INCIDENCE_RATE: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.LRI.REMISSION_RATE: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.LRI.DISABILITY_WEIGHT: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.LRI.EMR: load_lri_excess_mortality_rate,
+    data_keys.LRI.CSMR: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.LRI.RESTRICTIONS: load_metadata,
+
+    data_keys.PEM.DISABILITY_WEIGHT: load_pem_disability_weight,
+    data_keys.PEM.EMR: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.PEM.CSMR: load_standard_gbd_2019_data_as_gbd_2020_data,
+    data_keys.PEM.RESTRICTIONS: load_metadata,
+
+    data_keys.WASTING.DISTRIBUTION: load_metadata,
+    data_keys.WASTING.ALT_DISTRIBUTION: load_metadata,
+    data_keys.WASTING.CATEGORIES: load_metadata,
+    data_keys.WASTING.EXPOSURE: load_gbd_2020_exposure,
+    data_keys.WASTING.RELATIVE_RISK: load_gbd_2020_rr,
+    data_keys.WASTING.PAF: load_paf,
+}
+
+# Keys whose loaders pull other keys through get_data. This mirrors the get_data calls
+# in those loaders and must be updated with them.
+DATA_DEPENDENCIES = {
+    data_keys.LRI.PREVALENCE: [data_keys.LRI.INCIDENCE_RATE],
+    data_keys.LRI.EMR: [data_keys.LRI.CSMR, data_keys.LRI.PREVALENCE],
+    data_keys.WASTING.PAF: [data_keys.WASTING.EXPOSURE, data_keys.WASTING.RELATIVE_RISK],
+}
@@ -1,8 +1,10 @@
+from functools import lru_cache
 from itertools import product
 from numbers import Real
-from typing import List, Union
+from typing import List, Tuple, Union
 import warnings
 
+import numpy as np
 import pandas as pd
 
 from gbd_mapping import causes, covariates, risk_factors, Cause, ModelableEntity, RiskFactor
@@ -16,13 +18,24 @@ from vivarium_inputs.validation.sim import validate_for_simulation
 
 from vivarium_compass_sam.constants.metadata import ARTIFACT_INDEX_COLUMNS, GBD_2020_AGE_GROUPS, GBD_2020_ROUND_ID
 
+# Columns kept from raw GBD draws, built once rather than on every load
+_DRAW_DATA_COLUMNS = vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS
+_EXPOSURE_DATA_COLUMNS = _DRAW_DATA_COLUMNS + ['parameter']
+_DRAW_AND_PARAMETER_COLUMNS = frozenset(vi_globals.DRAW_COLUMNS + ['parameter'])
+
+
+@lru_cache()
+def _get_location_id(location: str) -> int:
+    # Looked up for every extraction, but fixed for a location
+    return utility_data.get_location_id(location)
+
 
 def _load_em_from_meid(location, meid, measure):
-    location_id = utility_data.get_location_id(location)
+    location_id = _get_location_id(location)
     data = gbd.get_modelable_entity_draws(meid, location_id)
     data = data[data.measure_id == vi_globals.MEASURES[measure]]
     data = vi_utils.normalize(data, fill_value=0)
-    data = data.filter(vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS)
+    data = data.filter(_DRAW_DATA_COLUMNS)
     data = vi_utils.reshape(data)
     data = vi_utils.scrub_gbd_conventions(data, location)
     data = vi_utils.split_interval(data, interval_column='age', split_column_prefix='age')
@@ -30,15 +43,17 @@ def _load_em_from_meid(location, meid, measure):
     return vi_utils.sort_hierarchical_data(data)
 
 
+# Map of entity types to their gbd mappings.
+ENTITY_TYPE_MAP = {
+    'cause': causes,
+    'covariate': covariates,
+    'risk_factor': risk_factors,
+    'alternative_risk_factor': alternative_risk_factors
+}
+
+
 def get_entity(key: EntityKey) -> ModelableEntity:
-    # Map of entity types to their gbd mappings.
-    type_map = {
-        'cause': causes,
-        'covariate': covariates,
-        'risk_factor': risk_factors,
-        'alternative_risk_factor': alternative_risk_factors
-    }
-    return type_map[key.type][key.name]
+    return ENTITY_TYPE_MAP[key.type][key.name]
 
 
 def reshape_gbd_2019_data_as_gbd_2020_data(gbd_2019_data: pd.DataFrame) -> pd.DataFrame:
@@ -107,7 +122,7 @@ def get_data(key: EntityKey, entity: ModelableEntity, location: str, source: str
              age_group_ids: List[int], gbd_round_id: int, decomp_step: str = 'iterative') -> pd.DataFrame:
     # from interface.get_measure
     # from vivarium_inputs.core.get_data
-    location_id = utility_data.get_location_id(location) if isinstance(location, str) else location
+    location_id = _get_location_id(location) if isinstance(location, str) else location
 
     # from vivarium_inputs.core.get_{measure}
     # from vivarium_inputs.extract.extract_data
@@ -159,12 +174,9 @@ def normalize_age_and_years(data: pd.DataFrame, fill_value: Real = None,
 
     if 'year_id' not in data:
         # Data doesn't vary by year, so copy for each year.
-        df = []
-        for year in years['annual']:
-            fill_data = data.copy()
-            fill_data['year_id'] = year
-            df.append(fill_data)
-        data = pd.concat(df, ignore_index=True)
+        n_rows = len(data)
+        data = data.iloc[np.tile(np.arange(n_rows), len(years['annual']))].reset_index(drop=True)
+        data['year_id'] = np.repeat(years['annual'], n_rows)
     elif set(data.year_id) == set(years['binned']):
         data = vi_utils.interpolate_year(data)
     else:  # set(data.year_id.unique()) == years['annual']
@@ -178,6 +190,12 @@ def normalize_age_and_years(data: pd.DataFrame, fill_value: Real = None,
 
 
 def get_gbd_2020_demographic_dimensions() -> pd.DataFrame:
+    # Used to reindex every loaded key, so only build the demographic index once
+    return _get_gbd_2020_demographic_dimensions().copy()
+
+
+@lru_cache()
+def _get_gbd_2020_demographic_dimensions() -> pd.DataFrame:
     estimation_years = get_gbd_estimation_years(GBD_2020_ROUND_ID)
     year_starts = range(estimation_years[0], estimation_years[-1] + 1)
     age_bins = get_gbd_age_bins(GBD_2020_AGE_GROUPS)
@@ -197,14 +215,24 @@ def apply_artifact_index(data: pd.DataFrame) -> pd.DataFrame:
         data['year_end'] = data['year_start'] + 1
     if 'age_end' not in data.columns:
         age_bins = get_gbd_age_bins(GBD_2020_AGE_GROUPS)
-        data['age_end'] = data['age_start'].apply(lambda x: {start: end for start, end
-                                                             in zip(age_bins.age_start, age_bins.age_end)}[x])
+        age_end_map = pd.Series(age_bins.age_end.to_numpy(), index=age_bins.age_start.to_numpy())
+        age_end = data['age_start'].map(age_end_map)
+        if age_end.isnull().any():
+            missing = sorted(set(data.loc[age_end.isnull(), 'age_start']))
+            raise KeyError(f'No GBD age bin starts at age_start values {missing}.')
+        data['age_end'] = age_end
     data = data.set_index(ARTIFACT_INDEX_COLUMNS)
     return data
 
 
 def get_gbd_estimation_years(gbd_round_id: int) -> List[int]:
     """Gets the estimation years for a particular gbd round."""
+    # Called for every normalized group and validated key, so only query the database once per round
+    return list(_get_gbd_estimation_years(gbd_round_id))
+
+
+@lru_cache()
+def _get_gbd_estimation_years(gbd_round_id: int) -> List[int]:
     from db_queries import get_demographics
     warnings.filterwarnings("default", module="db_queries")
 
@@ -253,17 +281,14 @@ def process_exposure(data: pd.DataFrame, key: str, entity: Union[RiskFactor, Alt
                          ignore_index=True)
 
         # normalize so all categories sum to 1
-        cols = list(set(data.columns).difference(vi_globals.DRAW_COLUMNS + ['parameter']))
-        data = data.set_index(cols + ['parameter'])
-        sums = (
-            data.groupby(cols)[vi_globals.DRAW_COLUMNS].sum()
-                .reindex(index=data.index)
-        )
-        data = data.divide(sums).reset_index()
+        cols = [column for column in data.columns if column not in _DRAW_AND_PARAMETER_COLUMNS]
+        sums = data.groupby(cols)[vi_globals.DRAW_COLUMNS].transform('sum')
+        # transform keeps the row order, so divide the arrays directly without indexing on the groups
+        data[vi_globals.DRAW_COLUMNS] = data[vi_globals.DRAW_COLUMNS].to_numpy() / sums.to_numpy()
     else:
         data = vi_utils.normalize(data, fill_value=0)
 
-    data = data.filter(vi_globals.DEMOGRAPHIC_COLUMNS + vi_globals.DRAW_COLUMNS + ['parameter'])
+    data = data.filter(_EXPOSURE_DATA_COLUMNS)
     data = validate_and_reshape_gbd_data(data, entity, key, location, age_group_ids, gbd_round_id)
     return data
 
@@ -279,6 +304,12 @@ def _scrub_age(data: pd.DataFrame, age_group_ids: List[int]) -> pd.DataFrame:
 
 
 def get_gbd_age_bins(age_group_ids: List[int]) -> pd.DataFrame:
+    # Age bins are fixed for a set of age groups, so only query the database once for each
+    return _get_gbd_age_bins(tuple(age_group_ids)).copy()
+
+
+@lru_cache()
+def _get_gbd_age_bins(age_group_ids: Tuple[int, ...]) -> pd.DataFrame:
     # from gbd.get_age_bins()
     q = f"""
                 SELECT age_group_id,
@@ -308,16 +339,20 @@ def filter_relative_risk_to_cause_restrictions(data: pd.DataFrame) -> pd.DataFra
     excess_mortality_rate, it applies the yll_age_restrictions to filter
     the relative_risk data"""
 
-    temp = []
-    affected_entities = set(data.affected_entity)
-    affected_measures = set(data.affected_measure)
-    for cause, measure in product(affected_entities, affected_measures):
-        df = data[(data.affected_entity == cause) & (data.affected_measure == measure)]
-        cause = get_gbd_2020_entity(EntityKey(f'cause.{cause}.{measure}'))
+    # Look up the age group restrictions once per affected cause and measure,
+    # then filter all rows with a single mask
+    pair_columns = ['affected_entity', 'affected_measure']
+    restrictions = {}
+    for cause_name, measure in data[pair_columns].drop_duplicates().itertuples(index=False):
+        cause = get_gbd_2020_entity(EntityKey(f'cause.{cause_name}.{measure}'))
         if measure == 'excess_mortality_rate':
-            start, end = vi_utils.get_age_group_ids_by_restriction(cause, 'yll')
+            restrictions[(cause_name, measure)] = vi_utils.get_age_group_ids_by_restriction(cause, 'yll')
         else:  # incidence_rate
-            start, end = vi_utils.get_age_group_ids_by_restriction(cause, 'yld')
-        temp.append(df[df.age_group_id.isin(range(start, end + 1))])
-    data = pd.concat(temp)
-    return data
+            restrictions[(cause_name, measure)] = vi_utils.get_age_group_ids_by_restriction(cause, 'yld')
+
+    age_group_bounds = (pd.DataFrame.from_dict(restrictions, orient='index', columns=['start', 'end'])
+                        .reindex(list(zip(data.affected_entity, data.affected_measure))))
+    age_group_id = data.age_group_id.to_numpy()
+    in_restrictions = ((age_group_bounds.start.to_numpy() <= age_group_id)
+                       & (age_group_id <= age_group_bounds.end.to_numpy()))
+    return data[in_restrictions]
@@ -1,4 +1,5 @@
 from pathlib import Path
+import re
 from typing import Dict, NamedTuple, Union
 
 import pandas as pd
@@ -21,6 +22,11 @@ OUTPUT_COLUMN_SORT_ORDER = [
     'measure',
     'input_draw'
 ]
+# Result column names are '{MEASURE}_in_{YEAR}_among_{SEX}_in_age_group_{AGE_GROUP}[_wasting_state_{WASTING_STATE}]'
+_PROCESS_COLUMN_REGEX = r'^(?P<measure>.+)_in_(?P<year>.+?)_among_(?P<sex>.+?)_in_age_group_(?P<age>.+?)'
+PROCESS_COLUMN_PATTERN = re.compile(_PROCESS_COLUMN_REGEX + r'$')
+WASTING_PROCESS_COLUMN_PATTERN = re.compile(_PROCESS_COLUMN_REGEX + r'_wasting_state_(?P<wasting_state>.+)$')
+PROCESS_COLUMN_FIELDS = ['wasting_state', 'age', 'sex', 'year', 'measure']
 
 
 def make_measure_data(data):
@@ -103,11 +109,11 @@ def aggregate_over_seed(data: pd.DataFrame) -> pd.DataFrame:
 
 
 def pivot_data(data: pd.DataFrame) -> pd.DataFrame:
+    # Melt straight to long format rather than stacking through a MultiIndex; rows are re-sorted downstream
     return (data
-            .set_index(GROUPBY_COLUMNS)
-            .stack()
-            .reset_index()
-            .rename(columns={f'level_{len(GROUPBY_COLUMNS)}': 'process', 0: 'value'}))
+            .melt(id_vars=GROUPBY_COLUMNS, var_name='process', value_name='value')
+            .dropna(subset=['value'])
+            .reset_index(drop=True))
 
 
 def sort_data(data: pd.DataFrame) -> pd.DataFrame:
@@ -118,12 +124,11 @@ def sort_data(data: pd.DataFrame) -> pd.DataFrame:
 
 
 def split_processing_column(data: pd.DataFrame, has_wasting_stratification: bool = True) -> pd.DataFrame:
-    if has_wasting_stratification:
-        data['process'], data['wasting_state'] = data.process.str.split(f'_wasting_state_').str
-    data['process'], data['age'] = data.process.str.split('_in_age_group_').str
-    data['process'], data['sex'] = data.process.str.split('_among_').str
-    data['year'] = data.process.str.split('_in_').str[-1]
-    data['measure'] = data.process.str.split('_in_').str[:-1].apply(lambda x: '_in_'.join(x))
+    pattern = WASTING_PROCESS_COLUMN_PATTERN if has_wasting_stratification else PROCESS_COLUMN_PATTERN
+    process_fields = data.process.str.extract(pattern)
+    for field in PROCESS_COLUMN_FIELDS:
+        if field in pattern.groupindex:
+            data[field] = process_fields[field]
     return data.drop(columns='process')
 
 
@@ -27,6 +27,12 @@ from vivarium_compass_sam.tools import build_artifacts, build_results, configure
 @click.option('-r', '--replace-keys',
               multiple=True,
               help='Specify keys to overwrite')
+@click.option('-w', '--preload-workers',
+              default=0,
+              show_default=True,
+              type=click.IntRange(min=0),
+              help=('Number of threads used to fetch data before writing it. Fetches GBD data concurrently, '
+                    'so only use if the data sources tolerate it. 0 loads each key as it is written.'))
 @click.option('-v', 'verbose',
               count=True,
               help='Configure logging verbosity.')
@@ -34,10 +40,10 @@ from vivarium_compass_sam.tools import build_artifacts, build_results, configure
               is_flag=True,
               help='Drop into python debugger if an error occurs.')
 def make_artifacts(location: str, output_dir: str, append: bool, replace_keys: Tuple[str, ...],
-                   verbose: int, with_debugger: bool) -> None:
+                   preload_workers: int, verbose: int, with_debugger: bool) -> None:
     configure_logging_to_terminal(verbose)
     main = handle_exceptions(build_artifacts, logger, with_debugger=with_debugger)
-    main(location, output_dir, append, replace_keys, verbose)
+    main(location, output_dir, append, replace_keys, verbose, preload_workers)
 
 
 @click.command()
@@ -51,12 +51,13 @@ def check_for_existing(output_dir: Path, location: str, append: bool, replace_ke
                           f' be deleted and regenerated. Do you want to delete and regenerate them?', abort=True)
 
 
-def build_single(location: str, output_dir: str, replace_keys: Tuple):
+def build_single(location: str, output_dir: str, replace_keys: Tuple, preload_workers: int = 0):
     path = Path(output_dir) / f'{sanitize_location(location)}.hdf'
-    build_single_location_artifact(path, location, replace_keys)
+    build_single_location_artifact(path, location, replace_keys, preload_workers=preload_workers)
 
 
-def build_artifacts(location: str, output_dir: str, append: bool, replace_keys: Tuple, verbose: int):
+def build_artifacts(location: str, output_dir: str, append: bool, replace_keys: Tuple, verbose: int,
+                    preload_workers: int = 0):
     """Main application function for building artifacts.
     Parameters
     ----------
@@ -76,6 +77,9 @@ def build_artifacts(location: str, output_dir: str, append: bool, replace_keys:
         False or if there is no existing artifact at the output location
     verbose
         How noisy the logger should be.
+    preload_workers
+        The number of threads used to load data before writing. If 0, data
+        is loaded one key at a time as it is written.
     """
     output_dir = Path(output_dir)
     vct.mkdir(output_dir, parents=True, exists_ok=True)
@@ -83,21 +87,21 @@ def build_artifacts(location: str, output_dir: str, append: bool, replace_keys:
     check_for_existing(output_dir, location, append, replace_keys)
 
     if location in metadata.LOCATIONS:
-        build_single(location, output_dir, replace_keys)
+        build_single(location, output_dir, replace_keys, preload_workers)
     elif location == 'all':
         if running_from_cluster():
             # parallel build when on cluster
-            build_all_artifacts(output_dir, verbose)
+            build_all_artifacts(output_dir, verbose, preload_workers)
         else:
             # serial build when not on cluster
             for loc in metadata.LOCATIONS:
-                build_single(loc, output_dir, replace_keys)
+                build_single(loc, output_dir, replace_keys, preload_workers)
     else:
         raise ValueError(f'Location must be one of {metadata.LOCATIONS} or the string "all". '
                          f'You specified {location}.')
 
 
-def build_all_artifacts(output_dir: Path, verbose: int):
+def build_all_artifacts(output_dir: Path, verbose: int, preload_workers: int = 0):
     """Builds artifacts for all locations in parallel.
     Parameters
     ----------
@@ -105,6 +109,9 @@ def build_all_artifacts(output_dir: Path, verbose: int):
         The directory where the artifacts will be built.
     verbose
         How noisy the logger should be.
+    preload_workers
+        The number of threads each job uses to load data before writing.
+        If 0, data is loaded one key at a time as it is written.
     Note
     ----
         This function should not be called directly.  It is intended to be
@@ -121,7 +128,7 @@ def build_all_artifacts(output_dir: Path, verbose: int):
 
             job_template = session.createJobTemplate()
             job_template.remoteCommand = shutil.which("python")
-            job_template.args = [__file__, str(path), f'"{location}"']
+            job_template.args = [__file__, str(path), f'"{location}"', str(preload_workers)]
             job_template.nativeSpecification = (f'-V '  # Export all environment variables
                                                 f'-b y '  # Command is a binary (python)
                                                 f'-P {metadata.CLUSTER_PROJECT} '  
@@ -154,7 +161,7 @@ def build_all_artifacts(output_dir: Path, verbose: int):
 
 
 def build_single_location_artifact(path: Union[str, Path], location: str, replace_keys: Tuple = (),
-                                   log_to_file: bool = False):
+                                   log_to_file: bool = False, preload_workers: int = 0):
     """Builds an artifact for a single location.
     Parameters
     ----------
@@ -167,6 +174,9 @@ def build_single_location_artifact(path: Union[str, Path], location: str, replac
         A list of artifact keys to replace
     log_to_file
         Whether we should write the application logs to a file.
+    preload_workers
+        The number of threads used to load data before writing. If 0, data
+        is loaded one key at a time as it is written.
     Note
     ----
         This function should not be called directly.  It is intended to be
@@ -182,16 +192,26 @@ def build_single_location_artifact(path: Union[str, Path], location: str, replac
         add_logging_sink(log_file, verbose=2)
 
     # Local import to avoid data dependencies
-    from vivarium_compass_sam.data import builder
+    from vivarium_compass_sam.data import builder, loader
 
-    logger.info(f'Building artifact for {location} at {str(path)}.')
-    artifact = builder.open_artifact(path, location)
-
-    for key_group in data_keys.MAKE_ARTIFACT_KEY_GROUPS:
-        logger.info(f'Loading and writing {key_group.log_name} data')
-        for key in key_group:
-            logger.info(f'   - Loading and writing {key} data')
-            builder.load_and_write_data(artifact, key, location, key in replace_keys)
+    try:
+        logger.info(f'Building artifact for {location} at {str(path)}.')
+        artifact = builder.open_artifact(path, location)
+
+        if preload_workers:
+            # Fetch data up front so independent keys load concurrently; writes below read from the loader cache
+            logger.info(f'Preloading data with {preload_workers} workers')
+            keys = [key for key_group in data_keys.MAKE_ARTIFACT_KEY_GROUPS for key in key_group]
+            builder.preload_data(artifact, keys, location, replace_keys, preload_workers)
+
+        for key_group in data_keys.MAKE_ARTIFACT_KEY_GROUPS:
+            logger.info(f'Loading and writing {key_group.log_name} data')
+            for key in key_group:
+                logger.info(f'   - Loading and writing {key} data')
+                builder.load_and_write_data(artifact, key, location, key in replace_keys)
+    finally:
+        # Loaded data is cached for the build; release it before the next location
+        loader.clear_data_cache()
 
     logger.info(f'**Done building -- {location}**')
 
@@ -199,4 +219,6 @@ def build_single_location_artifact(path: Union[str, Path], location: str, replac
 if __name__ == "__main__":
     artifact_path = sys.argv[1]
     artifact_location = sys.argv[2]
-    build_single_location_artifact(artifact_path, artifact_location, log_to_file=True)
+    artifact_preload_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    build_single_location_artifact(artifact_path, artifact_location, log_to_file=True,
+                                   preload_workers=artifact_preload_workers)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import click
 import numpy as np
 import pandas as pd
@@ -89,6 +91,7 @@ def get_norm_from_quantiles(mean: float, lower: float, upper: float,
     return stats.norm(loc=mean, scale=sd)
 
 
+@lru_cache()
 def get_lognorm_from_quantiles(median: float, lower: float, upper: float,
                                quantiles: Tuple[float, float] = (0.025, 0.975)) -> stats.lognorm:
     """Returns a frozen lognormal distribution with the specified median, such that